@@ -365,23 +365,44 @@ inline void FileWriter_add_reads_pre_compressed(
 }
 
 inline void decompress_signal_wrapper(
-        py::array_t<uint8_t, py::array::c_style | py::array::forcecast> const& compressed_signal,
+        py::buffer const& compressed_signal,
         py::array_t<std::int16_t, py::array::c_style | py::array::forcecast>& signal_out) {
-    throw_on_error(pod5::decompress_signal(
-            gsl::make_span(compressed_signal.data(0), compressed_signal.shape(0)),
-            arrow::system_memory_pool(),
-            gsl::make_span(signal_out.mutable_data(0), signal_out.shape(0))));
+    // Consume the buffer protocol pointer directly, so memoryviews over arrow buffers
+    // (and numpy arrays) are decompressed without an intermediate copy.
+    auto const compressed_info = compressed_signal.request();
+    if (compressed_info.ndim != 1 || compressed_info.itemsize != 1) {
+        throw std::runtime_error("Compressed signal must be a one dimensional byte buffer");
+    }
+    if (compressed_info.strides[0] != 1) {
+        throw std::runtime_error("Compressed signal must be a contiguous byte buffer");
+    }
+
+    auto const compressed_span = gsl::make_span(
+            static_cast<std::uint8_t const*>(compressed_info.ptr), compressed_info.size);
+    auto const signal_span = gsl::make_span(signal_out.mutable_data(0), signal_out.shape(0));
+
+    // Decompression only touches the spans above, let other python threads run meanwhile.
+    // throw_on_error may throw with the GIL released, this is safe as it makes no python
+    // API calls, and the GIL is reacquired as release_gil unwinds.
+    py::gil_scoped_release release_gil;
+    throw_on_error(
+            pod5::decompress_signal(compressed_span, arrow::system_memory_pool(), signal_span));
 }
 
 inline std::size_t compress_signal_wrapper(
         py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const& signal,
         py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast>&
                 compressed_signal_out) {
-    auto size = throw_on_error(pod5::compress_signal(
-            gsl::make_span(signal.data(), signal.shape(0)), arrow::system_memory_pool(),
-            gsl::make_span(compressed_signal_out.mutable_data(), compressed_signal_out.shape(0))));
-
-    return size;
+    auto const signal_span = gsl::make_span(signal.data(), signal.shape(0));
+    auto const compressed_span =
+            gsl::make_span(compressed_signal_out.mutable_data(), compressed_signal_out.shape(0));
+
+    // Compression only touches the spans above, let other python threads run meanwhile.
+    // throw_on_error may throw with the GIL released, this is safe as it makes no python
+    // API calls, and the GIL is reacquired as release_gil unwinds.
+    py::gil_scoped_release release_gil;
+    return throw_on_error(
+            pod5::compress_signal(signal_span, arrow::system_memory_pool(), compressed_span));
 }
 
 inline std::size_t vbz_compressed_signal_max_size(std::size_t sample_count) {
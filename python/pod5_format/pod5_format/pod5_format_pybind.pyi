@@ -6,7 +6,7 @@ c++ bindings for pod5_format
 # > pip install mypy
 # > stubgen -m pod5_format.pod5_format_pybind
 
-from typing import Any, Iterable, List, Tuple
+from typing import Any, Iterable, List, Tuple, Union
 
 import numpy
 
@@ -161,7 +161,8 @@ def create_split_file(
     options: FileWriterOptions = ...,
 ) -> FileWriter: ...
 def decompress_signal(
-    arg0: numpy.ndarray[numpy.uint8], arg1: numpy.ndarray[numpy.int16]
+    arg0: Union[numpy.ndarray[numpy.uint8], memoryview],
+    arg1: numpy.ndarray[numpy.int16],
 ) -> None: ...
 def format_read_id_to_str(arg0: numpy.ndarray[numpy.uint8]) -> list: ...
 def get_error_string() -> str: ...
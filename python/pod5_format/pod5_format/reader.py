@@ -265,6 +265,10 @@ class ReadRecord:
             return self._batch_signal_cache[self._row]
 
         rows = self._batch.columns.signal[self._row]
+        if len(rows) == 1 and self._reader.is_vbz_compressed:
+            # Most reads are a single chunk, skip the per-chunk bookkeeping below
+            return self._get_signal_for_row(rows[0].as_py())
+
         batch_data = [self._find_signal_row_index(r.as_py()) for r in rows]
         sample_counts = []
         for batch, _, batch_row_index in batch_data:
@@ -2,6 +2,10 @@
 Tools to assist repacking pod5 data into other pod5 files
 """
 import time
+import typing
+
+import numpy
+import numpy.typing
 
 import pod5_format as p5
 import pod5_format.pod5_format_pybind as p5b
@@ -56,12 +60,21 @@ class Repacker:
         return self._repacker.add_output(output_file._writer)
 
     def add_selected_reads_to_output(
-        self, output_ref, reader: p5.Reader, selected_read_ids
+        self,
+        output_ref,
+        reader: p5.Reader,
+        selected_read_ids: typing.Union[
+            typing.Collection[str], numpy.typing.NDArray[numpy.uint8]
+        ],
     ):
         """
         Add specific read ids in a source file to an output file.
 
         Passing an already wrapped output, a file, and a list of read ids will pack the passed read ids into the destination file.
+
+        The read ids may also be given already packed as a uint8 array of shape
+        (N, 16) (see `pod5_format.pack_read_ids`), avoiding parsing the read id
+        strings again when selecting the same reads repeatedly.
         """
         successful_finds, per_batch_counts, all_batch_rows = reader._plan_traversal(
             selected_read_ids
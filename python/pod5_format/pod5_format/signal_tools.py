@@ -2,21 +2,26 @@
 Tools for handling pod5 signals
 """
 
+import typing
+
 import numpy
 import numpy.typing
 import pod5_format.pod5_format_pybind as p5b
 
+CompressedSignal = typing.Union[numpy.typing.NDArray[numpy.uint8], memoryview]
+
 
 def vbz_decompress_signal(
-    compressed_signal: numpy.typing.NDArray[numpy.uint8], sample_count: int
+    compressed_signal: CompressedSignal, sample_count: int
 ) -> numpy.typing.NDArray[numpy.int16]:
     """
     Decompress a numpy array of compressed signal data
 
     Parameters
     ----------
-    compressed_signal : numpy.array
-        The array of compressed signal data to decompress.
+    compressed_signal : numpy.array or memoryview
+        The array of compressed signal data to decompress. Any contiguous byte
+        buffer is read in place without being copied.
     sample_count : int
         The sample count of the decompressed data.
 
@@ -31,7 +36,7 @@ def vbz_decompress_signal(
 
 
 def vbz_decompress_signal_into(
-    compressed_signal: numpy.typing.NDArray[numpy.uint8],
+    compressed_signal: CompressedSignal,
     output_array: numpy.typing.NDArray[numpy.int16],
 ) -> numpy.typing.NDArray[numpy.int16]:
     """
@@ -39,8 +44,9 @@ def vbz_decompress_signal_into(
 
     Parameters
     ----------
-    compressed_signal : numpy.array
-        The array of compressed signal data to decompress.
+    compressed_signal : numpy.array or memoryview
+        The array of compressed signal data to decompress. Any contiguous byte
+        buffer is read in place without being copied.
     output_array : numpy.array
         The destination location for signal
 
@@ -68,9 +74,10 @@ def vbz_compress_signal(
     A compressed numpy byte array
     """
     max_signal_size = p5b.vbz_compressed_signal_max_size(len(signal))
-    signal_bytes = numpy.zeros(max_signal_size, dtype="u1")
+    signal_bytes = numpy.empty(max_signal_size, dtype="u1")
 
     size = p5b.compress_signal(signal, signal_bytes)
 
-    signal_bytes = numpy.resize(signal_bytes, size)
+    # Trim in place, the buffer is only referenced here so no copy is required.
+    signal_bytes.resize(size, refcheck=False)
     return signal_bytes
@@ -75,7 +75,6 @@ setup(
     package_data={"pod5_format": data_files},
     install_requires=[
         "iso8601",
-        "more_itertools",
         "numpy",
         "pyarrow ~= 7.0.0",
         "pytz",
@@ -294,3 +294,16 @@ def test_pyarrow_split_one_name():
 
         with p5.Reader.from_inferred_split(split_path) as _fh:
             run_reader_test(_fh)
+
+
+def test_vbz_decompress_signal_memoryview():
+    signal = gen_test_read(0).signal
+    compressed = p5.vbz_compress_signal(signal)
+
+    from_array = p5.vbz_decompress_signal(compressed, len(signal))
+    from_view = p5.vbz_decompress_signal(memoryview(compressed.tobytes()), len(signal))
+    assert (from_array == signal).all()
+    assert (from_view == signal).all()
+
+    with pytest.raises(RuntimeError):
+        p5.vbz_decompress_signal(memoryview(signal), len(signal))
@@ -3,26 +3,31 @@ Tool for converting fast5 files to the pod5 format
 """
 
 import argparse
+import binascii
 from collections import namedtuple
 import datetime
+import heapq
+import os
 from pathlib import Path
 import sys
 import time
 import typing
-import uuid
 import multiprocessing as mp
 from queue import Empty
 
 import h5py
 import iso8601
 import numpy
-import more_itertools
 from ont_fast5_api.compression_settings import register_plugin
 
 import pod5_format as p5
 from pod5_format.reader_utils import make_split_filename
 
-from .utils import iterate_inputs
+from .utils import (
+    add_force_overwrite_argument,
+    add_recursive_argument,
+    iterate_inputs,
+)
 
 
 register_plugin()
@@ -34,6 +39,17 @@ def h5py_get_str(value):
     return value.decode("utf-8")
 
 
+def read_id_to_bytes(read_id) -> bytes:
+    """Return the 16 byte binary form of a fast5 read_id string"""
+    if isinstance(read_id, str):
+        read_id = read_id.encode("ascii")
+    # Equivalent to uuid.UUID(read_id).bytes, without the regex and int parsing
+    read_id_bytes = binascii.unhexlify(read_id.replace(b"-", b""))
+    if len(read_id_bytes) != 16:
+        raise ValueError(f"Invalid read_id: {read_id!r}")
+    return read_id_bytes
+
+
 def format_sample_count(count):
     units = [
         (1000000000000, "T"),
@@ -49,32 +65,38 @@ def format_sample_count(count):
     return f"{count} Samples"
 
 
+# Pod5 end reasons for each fast5 end_reason value, any other value is unknown.
+END_REASONS = {
+    2: p5.EndReason(name=p5.EndReasonEnum.MUX_CHANGE, forced=True),
+    3: p5.EndReason(name=p5.EndReasonEnum.UNBLOCK_MUX_CHANGE, forced=True),
+    4: p5.EndReason(name=p5.EndReasonEnum.DATA_SERVICE_UNBLOCK_MUX_CHANGE, forced=True),
+    5: p5.EndReason(name=p5.EndReasonEnum.SIGNAL_POSITIVE, forced=False),
+    6: p5.EndReason(name=p5.EndReasonEnum.SIGNAL_NEGATIVE, forced=False),
+}
+UNKNOWN_END_REASON = p5.EndReason(name=p5.EndReasonEnum.UNKNOWN, forced=False)
+
+
 def find_end_reason(end_reason: int) -> p5.EndReason:
     """Return a Pod5EndReason instance from the given end_reason integer"""
-    if end_reason is not None:
-        if end_reason == 2:
-            return p5.EndReason(name=p5.EndReasonEnum.MUX_CHANGE, forced=True)
-        if end_reason == 3:
-            return p5.EndReason(name=p5.EndReasonEnum.UNBLOCK_MUX_CHANGE, forced=True)
-        if end_reason == 4:
-            return p5.EndReason(
-                name=p5.EndReasonEnum.DATA_SERVICE_UNBLOCK_MUX_CHANGE, forced=True
-            )
-        if end_reason == 5:
-            return p5.EndReason(name=p5.EndReasonEnum.SIGNAL_POSITIVE, forced=False)
-        if end_reason == 6:
-            return p5.EndReason(name=p5.EndReasonEnum.SIGNAL_NEGATIVE, forced=False)
-    return p5.EndReason(name=p5.EndReasonEnum.UNKNOWN, forced=False)
+    return END_REASONS.get(end_reason, UNKNOWN_END_REASON)
 
 
 def get_datetime_as_epoch_ms(time_str):
-    epoch = datetime.datetime.utcfromtimestamp(0).replace(tzinfo=datetime.timezone.utc)
-    if time_str == None:
+    if time_str is None:
         return 0
+    time_str = h5py_get_str(time_str)
     try:
-        return iso8601.parse_date(h5py_get_str(time_str))
-    except iso8601.iso8601.ParseError:
-        return 0
+        # The stdlib parser handles the usual MinKNOW format without iso8601's regexes
+        parsed = datetime.datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            return iso8601.parse_date(time_str)
+        except iso8601.iso8601.ParseError:
+            return 0
+    if parsed.tzinfo is None:
+        # Match iso8601, which treats times without an offset as UTC
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
 
 
 ReadRequest = namedtuple("ReadRequest", [])
@@ -85,13 +107,26 @@ ReadList = namedtuple("ReadList", ["file", "reads"])
 
 READ_CHUNK_SIZE = 100
 
+# Input files are only ever read, so skip hdf5's advisory file locking where the
+# installed h5py and hdf5 support turning it off.
+H5PY_OPEN_KWARGS = {}
+if h5py.version.version_tuple >= (3, 5) and (
+    h5py.version.hdf5_version_tuple >= (1, 12, 1)
+    or (1, 10, 7) <= h5py.version.hdf5_version_tuple < (1, 11)
+):
+    H5PY_OPEN_KWARGS["locking"] = False
 
-class RunCache:
-    """Store the aquisition_id for caching the run_info for each fast5 file"""
 
-    def __init__(self, acq_id, run_info):
-        self.acquisition_id = acq_id
-        self.run_info = run_info
+def advise_file_access(path: Path, advice: int) -> None:
+    """
+    Hint to the kernel how path is about to be used, advice is one of the
+    os.POSIX_FADV_* values. Only call where os.posix_fadvise is available.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    finally:
+        os.close(fd)
 
 
 def create_run_info(
@@ -115,7 +150,7 @@ def create_run_info(
             tracking_id.get("protocol_start_time", None)
         ),
         sample_id=h5py_get_str(tracking_id["sample_id"]),
-        sample_rate=int(channel_id.attrs["sampling_rate"]),
+        sample_rate=int(channel_id["sampling_rate"]),
         sequencing_kit=h5py_get_str(context_tags.get("sequencing_kit", b"")),
         sequencer_position=h5py_get_str(tracking_id.get("device_id", b"")),
         sequencer_position_type=h5py_get_str(
@@ -134,57 +169,87 @@ def get_reads_from_files(
     # Persist this flag in case we encounter an error in a file.
     has_request_for_reads = False
 
+    # Signal is read into this buffer, it is only grown when a longer read is seen.
+    # Signal is compressed out of it before the next read overwrites it.
+    signal_buffer = numpy.empty(0, dtype=numpy.int16)
+
+    # Run info for each acquisition_id seen by this worker, shared across files.
+    run_infos: typing.Dict[typing.Union[str, bytes], p5.RunInfo] = {}
+    # Pores and calibrations repeat across reads, share one instance per distinct value.
+    # Keys are the raw attribute values so strings are only decoded on a miss.
+    pores: typing.Dict[typing.Tuple, p5.Pore] = {}
+    calibrations: typing.Dict[typing.Tuple, p5.Calibration] = {}
+
+    has_fadvise = hasattr(os, "posix_fadvise")
+
     for fast5_file in fast5_files:
         file_read_sent_count = 0
         try:
-            with h5py.File(str(fast5_file), "r") as inp:
-                run_cache = None
-                out_q.put(StartFile(len(inp.keys())))
-
-                for keys in more_itertools.chunked(inp.keys(), READ_CHUNK_SIZE):
+            if has_fadvise:
+                # Start the kernel reading the whole file ahead of hdf5's small reads.
+                advise_file_access(fast5_file, os.POSIX_FADV_WILLNEED)
+            with h5py.File(str(fast5_file), "r", **H5PY_OPEN_KWARGS) as inp:
+                read_keys = list(inp.keys())
+                out_q.put(StartFile(len(read_keys)))
+
+                for chunk_start in range(0, len(read_keys), READ_CHUNK_SIZE):
                     # Allow the out queue to throttle us back if we are too far ahead.
-                    while not has_request_for_reads:
-                        try:
-                            _ = in_q.get(timeout=1)
-                            has_request_for_reads = True
-                            break
-                        except Empty:
-                            continue
+                    if not has_request_for_reads:
+                        _ = in_q.get()
+                        has_request_for_reads = True
 
                     reads = []
-                    for key in keys:
-                        attrs = inp[key].attrs
-                        channel_id = inp[key]["channel_id"]
-                        raw = inp[key]["Raw"]
-
-                        pore_type = p5.Pore(
-                            channel=int(channel_id.attrs["channel_number"]),
-                            well=raw.attrs["start_mux"],
-                            pore_type=h5py_get_str(attrs.get("pore_type", b"not_set")),
-                        )
-                        calibration_type = p5.Calibration.from_range(
-                            offset=channel_id.attrs["offset"],
-                            adc_range=channel_id.attrs["range"],
-                            digitisation=channel_id.attrs["digitisation"],
+                    for key in read_keys[chunk_start : chunk_start + READ_CHUNK_SIZE]:
+                        read = inp[key]
+                        raw = read["Raw"]
+                        # Materialise each attribute set once, every lookup on an
+                        # h5py AttributeManager is a separate trip into hdf5.
+                        attrs = dict(read.attrs)
+                        channel_id = dict(read["channel_id"].attrs)
+                        raw_attrs = dict(raw.attrs)
+
+                        pore_key = (
+                            channel_id["channel_number"],
+                            raw_attrs["start_mux"],
+                            attrs.get("pore_type", b"not_set"),
                         )
-                        end_reason_type = find_end_reason(
-                            raw.attrs["end_reason"]
-                            if "end_reason" in raw.attrs
-                            else None
+                        pore_type = pores.get(pore_key)
+                        if pore_type is None:
+                            pore_type = p5.Pore(
+                                channel=int(pore_key[0]),
+                                well=pore_key[1],
+                                pore_type=h5py_get_str(pore_key[2]),
+                            )
+                            pores[pore_key] = pore_type
+
+                        calibration_key = (
+                            channel_id["offset"],
+                            channel_id["range"],
+                            channel_id["digitisation"],
                         )
+                        calibration_type = calibrations.get(calibration_key)
+                        if calibration_type is None:
+                            calibration_type = p5.Calibration.from_range(
+                                offset=calibration_key[0],
+                                adc_range=calibration_key[1],
+                                digitisation=calibration_key[2],
+                            )
+                            calibrations[calibration_key] = calibration_type
+                        end_reason_type = find_end_reason(raw_attrs.get("end_reason"))
 
                         if "run_id" in attrs:
-                            acq_id = h5py_get_str(attrs["run_id"])
+                            run_id = attrs["run_id"]
                         else:
-                            acq_id = h5py_get_str(
-                                inp[key]["tracking_id"].attrs["run_id"]
-                            )
+                            run_id = read["tracking_id"].attrs["run_id"]
 
-                        if not run_cache or run_cache.acquisition_id != acq_id:
+                        # Keyed by the raw run_id, so it is only decoded on a miss.
+                        run_info_type = run_infos.get(run_id)
+                        if run_info_type is None:
+                            acq_id = h5py_get_str(run_id)
                             adc_min = 0
                             adc_max = 2047
                             device_type_guess = "promethion"
-                            if channel_id.attrs["digitisation"] == 8192:
+                            if channel_id["digitisation"] == 8192:
                                 adc_min = -4096
                                 adc_max = 4095
                                 device_type_guess = "minion"
@@ -194,16 +259,19 @@ def get_reads_from_files(
                                 adc_max=adc_max,
                                 adc_min=adc_min,
                                 channel_id=channel_id,
-                                context_tags=dict(inp[key]["context_tags"].attrs),
+                                context_tags=dict(read["context_tags"].attrs),
                                 device_type=device_type_guess,
-                                tracking_id=dict(inp[key]["tracking_id"].attrs),
+                                tracking_id=dict(read["tracking_id"].attrs),
                             )
-                            run_cache = RunCache(acq_id, run_info_type)
-                        else:
-                            run_info_type = run_cache.run_info
-
-                        signal = raw["Signal"][()]
-                        sample_count = signal.shape[0]
+                            run_infos[run_id] = run_info_type
+
+                        signal_dataset = raw["Signal"]
+                        sample_count = signal_dataset.shape[0]
+                        if signal_buffer.shape[0] < sample_count:
+                            signal_buffer = numpy.empty(sample_count, dtype=numpy.int16)
+                        signal = signal_buffer[:sample_count]
+                        if sample_count > 0:
+                            signal_dataset.read_direct(signal)
                         if pre_compress_signal:
                             sample_count = []
                             signal_arr = []
@@ -216,12 +284,12 @@ def get_reads_from_files(
 
                         reads.append(
                             p5.Read(
-                                uuid.UUID(h5py_get_str(raw.attrs["read_id"])).bytes,
+                                read_id_to_bytes(raw_attrs["read_id"]),
                                 pore_type,
                                 calibration_type,
-                                raw.attrs["read_number"],
-                                raw.attrs["start_time"],
-                                raw.attrs["median_before"],
+                                raw_attrs["read_number"],
+                                raw_attrs["start_time"],
+                                raw_attrs["median_before"],
                                 end_reason_type,
                                 run_info_type,
                                 signal_arr,
@@ -237,10 +305,43 @@ def get_reads_from_files(
 
             traceback.print_exc()
             print(f"Error in file {fast5_file}: {exc}", file=sys.stderr)
+        finally:
+            if has_fadvise:
+                # Each input is only visited once, release its pages from the cache.
+                try:
+                    advise_file_access(fast5_file, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    # Any problem opening the file has already been reported above.
+                    pass
 
         out_q.put(EndFile(fast5_file, file_read_sent_count))
 
 
+def divide_files(
+    files: typing.Sequence[Path], reader_count: int
+) -> typing.List[typing.List[Path]]:
+    """
+    Split files between at most reader_count readers, giving each reader a similar
+    total number of bytes to convert
+    """
+    # Largest first onto the least loaded reader keeps the totals close.
+    loads = [(0, idx) for idx in range(min(reader_count, len(files)))]
+    reader_files: typing.List[typing.List[Path]] = [[] for _ in loads]
+    sized_files = []
+    for path in files:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            # Leave the error to be reported by the reader assigned this file
+            size = 0
+        sized_files.append((size, path))
+    for size, path in sorted(sized_files, reverse=True):
+        load, idx = heapq.heappop(loads)
+        reader_files[idx].append(path)
+        heapq.heappush(loads, (load + size, idx))
+    return reader_files
+
+
 def add_reads(
     writer: p5.Writer,
     reads: typing.Iterable[p5.Read],
@@ -354,13 +455,7 @@ def main():
 
     parser.add_argument("input", type=Path, nargs="+", help="Input path for fast5 file")
     parser.add_argument("output", type=Path, help="Output path for the pod5 file(s)")
-    parser.add_argument(
-        "-r",
-        "--recursive",
-        default=False,
-        action="store_true",
-        help="Search for input files recursively",
-    )
+    add_recursive_argument(parser)
     parser.add_argument(
         "--active-readers",
         default=10,
@@ -377,9 +472,7 @@ def main():
         action="store_true",
         help="Output files should use the pod5 split format.",
     )
-    parser.add_argument(
-        "--force-overwrite", action="store_true", help="Overwrite destination files"
-    )
+    add_force_overwrite_argument(parser)
     parser.add_argument(
         "--signal-chunk-size",
         default=102400,
@@ -388,7 +481,15 @@ def main():
 
     args = parser.parse_args()
 
-    ctx = mp.get_context("spawn")
+    # Readers are started from a small forkserver process where available, rather than
+    # a fresh interpreter each. Fall back to spawn on platforms without it (Windows).
+    start_method = "spawn"
+    if "forkserver" in mp.get_all_start_methods():
+        start_method = "forkserver"
+    ctx = mp.get_context(start_method)
+    if start_method == "forkserver":
+        # Import h5py, numpy and pod5_format once in the server, not in every reader.
+        ctx.set_forkserver_preload(["pod5_format_tools.pod5_convert_from_fast5"])
     read_request_queue = ctx.Queue()
     read_data_queue = ctx.Queue()
 
@@ -398,11 +499,8 @@ def main():
     # Divide up files between readers:
     pending_files = list(iterate_inputs(args.input, args.recursive, "*.fast5"))
     file_count = len(pending_files)
-    items_per_reads = max(1, len(pending_files) // args.active_readers)
     active_processes: typing.List[mp.Process] = []
-    while pending_files:
-        files = pending_files[:items_per_reads]
-        pending_files = pending_files[items_per_reads:]
+    for files in divide_files(pending_files, max(1, args.active_readers)):
         p = ctx.Process(
             target=get_reads_from_files,
             args=(
@@ -12,7 +12,11 @@ import numpy
 from ont_fast5_api.compression_settings import register_plugin
 import pod5_format as p5
 
-from .utils import iterate_inputs
+from .utils import (
+    add_force_overwrite_argument,
+    add_recursive_argument,
+    iterate_inputs,
+)
 
 
 register_plugin()
@@ -58,19 +62,12 @@ Read = namedtuple(
 Fast5FileData = namedtuple("Fast5FileData", ["filename", "reads"])
 
 
-def do_write_fast5_files(write_request_queue, write_data_queue, exit_queue):
+def do_write_fast5_files(write_request_queue, write_data_queue):
     while True:
-        # Try to get some data to write:
-        try:
-            file_data = write_data_queue.get(timeout=0.1)
-        except:
-            # Check if we are requested to exit:
-            try:
-                exit_queue.get(timeout=0.1)
-                break
-            except:
-                pass
-            continue
+        # Wait for some data to write, None is sent once there is no more:
+        file_data = write_data_queue.get()
+        if file_data is None:
+            break
 
         end_reason_dict = {
             "unknown": 0,
@@ -193,22 +190,14 @@ def main():
 
     parser.add_argument("input", type=Path, nargs="+")
     parser.add_argument("output", type=Path)
-    parser.add_argument(
-        "-r",
-        "--recursive",
-        default=False,
-        action="store_true",
-        help="Search for input files recursively",
-    )
+    add_recursive_argument(parser)
     parser.add_argument(
         "--active-writers",
         default=10,
         type=int,
         help="How many file writers to keep active",
     )
-    parser.add_argument(
-        "--force-overwrite", action="store_true", help="Overwrite destination files"
-    )
+    add_force_overwrite_argument(parser)
     parser.add_argument(
         "--file-read-count",
         default=4000,
@@ -221,7 +210,6 @@ def main():
     ctx = mp.get_context("spawn")
     write_request_queue = ctx.Queue()
     write_data_queue = ctx.Queue()
-    write_exit_queue = ctx.Queue()
 
     active_processes = []
 
@@ -236,7 +224,6 @@ def main():
             args=(
                 write_request_queue,
                 write_data_queue,
-                write_exit_queue,
             ),
         )
         p.start()
@@ -300,13 +287,14 @@ def main():
 
     print(f"Conversion complete: {sample_count} samples")
 
+    # Queued after all file data, so each writer exits once the work is drained.
     for p in active_processes:
-        write_exit_queue.put(None)
+        write_data_queue.put(None)
 
     for p in active_processes:
         p.join()
 
-    for q in [write_request_queue, write_data_queue, write_exit_queue]:
+    for q in [write_request_queue, write_data_queue]:
         q.close()
         q.join_thread()
 
@@ -9,13 +9,12 @@ import json
 from pathlib import Path
 import typing
 
-import jsonschema
-import pandas as pd
-
 import pod5_format as p5
 import pod5_format.pod5_format_pybind as p5b
 import pod5_format.repack as p5_repack
 
+from .utils import HELP_FORCE_OVERWRITE
+
 # Json Schema used to validate json mapping
 JSON_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
@@ -70,7 +69,7 @@ def prepare_pod5_demux_argparser() -> argparse.ArgumentParser:
         "-f",
         "--force_overwrite",
         action="store_true",
-        help="Overwrite destination files",
+        help=HELP_FORCE_OVERWRITE,
     )
 
     mapping_group = parser.add_argument_group("direct mapping")
@@ -152,6 +151,9 @@ def parse_summary_mapping(
         filename_template, demux_columns, ignore_incomplete_template
     )
 
+    # pandas is slow to import and only needed for summary mappings
+    import pandas as pd
+
     # Parse the summary using pandas asserting that usecols exists
     summary = pd.read_table(summary_path, usecols=demux_columns + [read_id_column])
 
@@ -259,6 +261,7 @@ def parse_csv_mapping(csv_path: Path) -> typing.Dict[str, typing.Set[str]]:
 
 def parse_json_mapping(json_path: Path) -> typing.Dict[str, typing.Set[str]]:
     """Parse the json direct mapping of output target to read_ids"""
+    import jsonschema
 
     with json_path.open("r") as _fh:
         json_data = json.load(_fh)
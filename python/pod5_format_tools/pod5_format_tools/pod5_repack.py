@@ -11,6 +11,8 @@ import typing
 import pod5_format as p5
 import pod5_format.repack
 
+from .utils import add_force_overwrite_argument
+
 
 def repack(inputs: typing.List[Path], output: Path, force_overwrite: bool):
     print(f"Repacking inputs {' '.join(str(i) for i in inputs)} into {output}")
@@ -59,9 +61,7 @@ def main():
     )
     parser.add_argument("output", type=Path, help="Output path for pod5 files")
 
-    parser.add_argument(
-        "--force-overwrite", action="store_true", help="Overwrite destination files"
-    )
+    add_force_overwrite_argument(parser)
 
     args = parser.parse_args()
 
@@ -1,6 +1,29 @@
+import argparse
 from pathlib import Path
 import typing
 
+# Help strings shared by the argument parsers of several tools
+HELP_FORCE_OVERWRITE = "Overwrite destination files"
+HELP_RECURSIVE = "Search for input files recursively"
+
+
+def add_recursive_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the -r/--recursive input search flag to parser"""
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        default=False,
+        action="store_true",
+        help=HELP_RECURSIVE,
+    )
+
+
+def add_force_overwrite_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --force-overwrite flag to parser"""
+    parser.add_argument(
+        "--force-overwrite", action="store_true", help=HELP_FORCE_OVERWRITE
+    )
+
 
 def iterate_inputs(
     input_items: typing.Iterable[Path], recursive: bool, file_pattern: str
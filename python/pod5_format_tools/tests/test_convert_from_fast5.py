@@ -0,0 +1,238 @@
+import datetime
+from pathlib import Path
+import queue
+import uuid
+
+import h5py
+import numpy
+import pod5_format as p5
+import pytest
+
+from pod5_format_tools.pod5_convert_from_fast5 import (
+    EndFile,
+    ReadList,
+    StartFile,
+    divide_files,
+    get_datetime_as_epoch_ms,
+    get_reads_from_files,
+    read_id_to_bytes,
+)
+
+TEST_DATA_PATH = Path(__file__).parent.parent.parent.parent / "test_data"
+FAST5_PATH = TEST_DATA_PATH / "multi_fast5_zip.fast5"
+
+# Small enough to split reads into several compressed signal chunks
+SIGNAL_CHUNK_SIZE = 1000
+
+FAST5_END_REASONS = {
+    2: p5.EndReason(name=p5.EndReasonEnum.MUX_CHANGE, forced=True),
+    3: p5.EndReason(name=p5.EndReasonEnum.UNBLOCK_MUX_CHANGE, forced=True),
+    4: p5.EndReason(name=p5.EndReasonEnum.DATA_SERVICE_UNBLOCK_MUX_CHANGE, forced=True),
+    5: p5.EndReason(name=p5.EndReasonEnum.SIGNAL_POSITIVE, forced=False),
+    6: p5.EndReason(name=p5.EndReasonEnum.SIGNAL_NEGATIVE, forced=False),
+}
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "time_str,expected",
+    [
+        (
+            "2019-06-24T10:41:22Z",
+            datetime.datetime(2019, 6, 24, 10, 41, 22, tzinfo=UTC),
+        ),
+        (
+            "2019-06-24T10:41:22.123+01:00",
+            datetime.datetime(
+                2019,
+                6,
+                24,
+                10,
+                41,
+                22,
+                123000,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+            ),
+        ),
+        # No offset is taken as UTC
+        (
+            "2019-06-24T10:41:22",
+            datetime.datetime(2019, 6, 24, 10, 41, 22, tzinfo=UTC),
+        ),
+        # Rejected by datetime.fromisoformat before python 3.11, parsed by iso8601
+        (
+            "2019-06-24T10:41:22.1234567Z",
+            datetime.datetime(2019, 6, 24, 10, 41, 22, 123456, tzinfo=UTC),
+        ),
+        (
+            b"2019-06-24T10:41:22Z",
+            datetime.datetime(2019, 6, 24, 10, 41, 22, tzinfo=UTC),
+        ),
+        ("not a time", 0),
+        (None, 0),
+    ],
+)
+def test_get_datetime_as_epoch_ms(time_str, expected):
+    """Check fast5 time strings are parsed to the expected timezone aware time"""
+    parsed = get_datetime_as_epoch_ms(time_str)
+    assert parsed == expected
+    if expected != 0:
+        assert parsed.utcoffset() == expected.utcoffset()
+
+
+class TestReadIdToBytes:
+    """Test packing fast5 read_id strings"""
+
+    READ_ID = "0000173c-bf67-44e7-9a9c-1ad0bc728e74"
+
+    @pytest.mark.parametrize("read_id", [READ_ID, READ_ID.encode("ascii")])
+    def test_matches_uuid(self, read_id):
+        """Packed bytes match uuid.UUID for both str and bytes attributes"""
+        assert read_id_to_bytes(read_id) == uuid.UUID(self.READ_ID).bytes
+
+    @pytest.mark.parametrize("read_id", [READ_ID[:-2], READ_ID[:-1], "not-a-read-id"])
+    def test_invalid(self, read_id):
+        """Truncated or non hex read ids are rejected"""
+        with pytest.raises(ValueError):
+            read_id_to_bytes(read_id)
+
+
+class TestDivideFiles:
+    """Test balancing input files between fast5 readers"""
+
+    @staticmethod
+    def _make_files(tmp_path: Path, sizes):
+        files = []
+        for idx, size in enumerate(sizes):
+            path = tmp_path / f"input_{idx}.fast5"
+            path.write_bytes(b"x" * size)
+            files.append(path)
+        return files
+
+    def test_no_files(self):
+        """No inputs start no readers"""
+        assert divide_files([], 4) == []
+
+    def test_reader_count_is_limit(self, tmp_path: Path):
+        """Never return more file lists than readers, and never drop a file"""
+        files = self._make_files(tmp_path, [1] * 10)
+        divided = divide_files(files, 3)
+        assert len(divided) == 3
+        assert sorted(f for reader in divided for f in reader) == sorted(files)
+
+        assert len(divide_files(files[:2], 3)) == 2
+
+    def test_balanced_by_size(self, tmp_path: Path):
+        """Readers are given a similar total number of bytes"""
+        files = self._make_files(tmp_path, [100, 10, 60, 40, 50, 40])
+        divided = divide_files(files, 2)
+        totals = sorted(sum(f.stat().st_size for f in reader) for reader in divided)
+        assert totals == [150, 150]
+
+    def test_missing_file(self, tmp_path: Path):
+        """Files that cannot be stat'ed are still assigned to a reader"""
+        files = self._make_files(tmp_path, [10, 20])
+        missing = tmp_path / "missing.fast5"
+        divided = divide_files(files + [missing], 2)
+        assert sorted(f for reader in divided for f in reader) == sorted(
+            files + [missing]
+        )
+
+
+class TestGetReadsFromFiles:
+    """Test the fast5 reader process body against values read directly with h5py"""
+
+    @staticmethod
+    def _convert(fast5_files):
+        in_q = queue.Queue()
+        out_q = queue.Queue()
+        # Grant enough requests up front that the reader is never throttled
+        for _ in range(1000):
+            in_q.put(object())
+
+        get_reads_from_files(in_q, out_q, fast5_files, True, SIGNAL_CHUNK_SIZE)
+
+        items = []
+        while not out_q.empty():
+            items.append(out_q.get())
+        return items
+
+    def test_convert_matches_fast5(self):
+        """
+        Convert the same file twice, so the per reader caches are shared across
+        files, and check every read matches the source fast5
+        """
+        items = self._convert([FAST5_PATH, FAST5_PATH])
+
+        with h5py.File(str(FAST5_PATH), "r") as f5:
+            keys = list(f5.keys())
+            read_count = len(keys)
+            assert read_count > 0
+
+            start_files = [i for i in items if isinstance(i, StartFile)]
+            end_files = [i for i in items if isinstance(i, EndFile)]
+            assert [s.read_count for s in start_files] == [read_count, read_count]
+            assert [e.read_count for e in end_files] == [read_count, read_count]
+
+            reads = [r for i in items if isinstance(i, ReadList) for r in i.reads]
+            assert len(reads) == 2 * read_count
+
+            for key, read, repeat in zip(keys, reads[:read_count], reads[read_count:]):
+                fast5_read = f5[key]
+                raw = fast5_read["Raw"]
+                channel_id = fast5_read["channel_id"]
+
+                assert read.read_id == uuid.UUID(_decode(raw.attrs["read_id"])).bytes
+                assert read.pore == p5.Pore(
+                    channel=int(channel_id.attrs["channel_number"]),
+                    well=raw.attrs["start_mux"],
+                    pore_type=_decode(fast5_read.attrs.get("pore_type", b"not_set")),
+                )
+                assert read.calibration == p5.Calibration.from_range(
+                    offset=channel_id.attrs["offset"],
+                    adc_range=channel_id.attrs["range"],
+                    digitisation=channel_id.attrs["digitisation"],
+                )
+                assert read.read_number == raw.attrs["read_number"]
+                assert read.start_time == raw.attrs["start_time"]
+                assert read.median_before == raw.attrs["median_before"]
+                assert read.end_reason == FAST5_END_REASONS.get(
+                    raw.attrs.get("end_reason"),
+                    p5.EndReason(name=p5.EndReasonEnum.UNKNOWN, forced=False),
+                )
+
+                if "run_id" in fast5_read.attrs:
+                    run_id = fast5_read.attrs["run_id"]
+                else:
+                    run_id = fast5_read["tracking_id"].attrs["run_id"]
+                assert read.run_info.acquisition_id == _decode(run_id)
+                assert read.run_info.sample_rate == int(
+                    channel_id.attrs["sampling_rate"]
+                )
+
+                # Signal is read into a reused buffer, make sure no read sees
+                # another's samples
+                signal = raw["Signal"][()]
+                assert sum(read.samples_count) == signal.shape[0]
+                assert all(c <= SIGNAL_CHUNK_SIZE for c in read.samples_count)
+                decompressed = [
+                    p5.vbz_decompress_signal(chunk, count)
+                    for chunk, count in zip(read.signal, read.samples_count)
+                ]
+                numpy.testing.assert_array_equal(
+                    numpy.concatenate(decompressed), signal
+                )
+
+                # The second pass over the file reuses the cached objects
+                assert repeat.read_id == read.read_id
+                assert repeat.pore is read.pore
+                assert repeat.calibration is read.calibration
+                assert repeat.run_info is read.run_info
@@ -1,5 +1,7 @@
 import json
 from pathlib import Path
+import subprocess
+import sys
 import typing
 
 import jsonschema
@@ -150,3 +152,18 @@ class TestDemuxAssertions:
 
         expected_err = "Duplicate outputs detected but --duplicate_ok not set"
         assert str(exc.value) == expected_err
+
+
+def test_demux_import_is_lazy():
+    """
+    Importing the demux tool (e.g. for --help) must not import pandas or jsonschema,
+    which are only needed for their respective mapping formats
+    """
+    script = (
+        "import sys, pod5_format_tools.pod5_demux; "
+        "print(sorted({'pandas', 'jsonschema'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "[]"